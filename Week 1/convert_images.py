@@ -1,14 +1,125 @@
+#!/usr/bin/env python3
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image
+import argparse
+import io
 import os
+import time
+import manifest
+import pipeline
+import scanner
 
 directory = "images/"
 output_directory = "/opt/icons/"
 
-#The for loop to correct the badly formatted images.
-for filename in os.listdir(directory):
-    if filename != ".DS_Store":
-        im = Image.open(os.path.join(directory, filename))
-        im = im.rotate(-90)
-        im = im.resize((128,128))
-        im = im.convert("RGB")
-        im.save(os.path.join(output_directory, filename+".jpeg"))
\ No newline at end of file
+# records what every output was produced from, so reruns skip unchanged sources:
+manifest_path = os.path.join(output_directory, ".manifest.json")
+
+# number of worker processes the conversion is spread across:
+workers = os.cpu_count()
+# threads reading sources & writing icons, so disk waits overlap with conversion:
+readers = 4
+writers = 4
+# images allowed to queue up before reading, converting & writing:
+depths = [16, 16, 16]
+
+
+def output_path(filename):
+    """Returns where the corrected version of filename is saved."""
+    return os.path.join(output_directory, filename+".jpeg")
+
+
+def read_source(filename):
+    """Reads the raw bytes of a source image."""
+    with open(os.path.join(directory, filename), "rb") as f:
+        return f.read()
+
+
+def convert(data):
+    """Corrects one badly formatted image held in data.
+
+    Returns (JPEG bytes, source hash, worker pid, seconds spent).
+    """
+    start = time.perf_counter()
+    im = Image.open(io.BytesIO(data))
+    im = im.rotate(-90)
+    im = im.resize((128,128))
+    im = im.convert("RGB")
+    out = io.BytesIO()
+    im.save(out, "JPEG")
+    return out.getvalue(), manifest.digest(data), os.getpid(), time.perf_counter() - start
+
+
+def write_icon(filename, converted):
+    """Saves a converted icon, returns (source hash, worker pid, seconds spent)."""
+    jpeg, sha256, pid, busy = converted
+    with open(output_path(filename), "wb") as f:
+        f.write(jpeg)
+    return sha256, pid, busy
+
+
+def report(stats, elapsed):
+    """Prints the throughput of each worker and of the whole run."""
+    total = 0
+    for pid, (count, busy) in sorted(stats.items()):
+        total += count
+        print("worker {}: {} images in {:.2f}s ({:.1f} images/s)".format(
+            pid, count, busy, count / busy if busy else 0))
+    print("converted {} images in {:.2f}s ({:.1f} images/s) with {} workers".format(
+        total, elapsed, total / elapsed if elapsed else 0, len(stats)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the badly formatted icons.")
+    parser.add_argument("-w", "--workers", type=int, default=workers,
+                        help="number of worker processes (default: %(default)s)")
+    parser.add_argument("-r", "--readers", type=int, default=readers,
+                        help="number of reader threads (default: %(default)s)")
+    parser.add_argument("--writers", type=int, default=writers,
+                        help="number of writer threads (default: %(default)s)")
+    parser.add_argument("-d", "--depths", type=int, nargs=3, default=depths,
+                        metavar=("READ", "CONVERT", "WRITE"),
+                        help="queue depth in front of each stage (default: %(default)s)")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="reconvert every image, ignoring the manifest")
+    args = parser.parse_args()
+
+    converted = {} if args.force else manifest.load(manifest_path)
+    sources = {}
+    files = []
+    for entry in scanner.scan(directory, exclude=[".DS_Store"]):
+        filename = os.path.basename(entry.path)
+        sources[filename] = (entry.size, entry.mtime)
+        if not manifest.is_current(converted, filename, entry.path, entry.size, entry.mtime):
+            files.append(filename)
+
+    for output in manifest.prune(converted, sources):
+        print("removed {}".format(output))
+    print("{} of {} images need converting".format(len(files), len(sources)))
+
+    #The pipeline reads, corrects & writes the badly formatted images at the same time,
+    #running the correction itself on every core.
+    stats = {}
+    start = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            for filename, result, error in pipeline.run(
+                    files, read_source, convert, write_icon, readers=args.readers,
+                    transformers=args.workers, writers=args.writers, depths=args.depths,
+                    executor=pool):
+                if error:
+                    print("error converting {}: {}".format(filename, error))
+                    continue
+                sha256, pid, busy = result
+                size, mtime = sources[filename]
+                manifest.record(converted, filename, size, mtime, sha256, output_path(filename))
+                count, total_busy = stats.get(pid, (0, 0.0))
+                stats[pid] = (count + 1, total_busy + busy)
+    finally:
+        # keep whatever finished, so an interrupted run isn't redone from scratch:
+        manifest.save(converted, manifest_path)
+    report(stats, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
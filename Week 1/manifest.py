@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+import os
+
+
+def load(path):
+    """Loads the manifest at path, or returns an empty one if there isn't one yet."""
+    try:
+        with open(path) as manifest_file:
+            return json.load(manifest_file)
+    except FileNotFoundError:
+        return {}
+
+
+def save(manifest, path):
+    """Writes the manifest to path, replacing the old one atomically."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def digest(data):
+    """Returns the content hash used to tell whether a source really changed."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path):
+    """Returns the content hash of the file at path."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def is_current(manifest, name, source, size, mtime):
+    """Checks whether the recorded output for name still matches its source.
+
+    Size and mtime settle most files without reading them; the content hash
+    is only computed when the size matches but the mtime moved (touched or
+    copied files). A matching hash refreshes the recorded mtime.
+    """
+    entry = manifest.get(name)
+    if entry is None or entry["size"] != size:
+        return False
+    if not os.path.exists(entry["output"]):
+        return False
+    if entry["mtime"] == mtime:
+        return True
+    if file_digest(source) != entry["sha256"]:
+        return False
+    entry["mtime"] = mtime
+    return True
+
+
+def record(manifest, name, size, mtime, sha256, output):
+    """Records the output produced from the source called name."""
+    manifest[name] = {"size": size, "mtime": mtime, "sha256": sha256, "output": output}
+
+
+def prune(manifest, names):
+    """Deletes outputs (and entries) whose source is no longer in names.
+
+    Returns the list of removed outputs.
+    """
+    removed = []
+    for name in [n for n in manifest if n not in names]:
+        output = manifest.pop(name)["output"]
+        try:
+            os.remove(output)
+        except FileNotFoundError:
+            pass
+        removed.append(output)
+    return removed
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import os
+import queue
+import threading
+
+# passed down a queue once there is no more work for the stage reading it:
+STOP = object()
+
+
+def _stage(count, inbox, outbox, work, results):
+    """Starts count threads moving (item, value, error) entries from inbox to outbox.
+
+    Each thread replaces value with work(item, value). An item whose work
+    raises goes straight to results with the error. The last thread to see
+    STOP passes it on to outbox.
+    """
+    remaining = [count]
+    lock = threading.Lock()
+
+    def loop():
+        while True:
+            entry = inbox.get()
+            if entry is STOP:
+                break
+            item, value, _ = entry
+            try:
+                value = work(item, value)
+            except Exception as e:
+                results.put((item, None, e))
+                continue
+            outbox.put((item, value, None))
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            outbox.put(STOP)
+        else:
+            # let the other threads of this stage see it too:
+            inbox.put(STOP)
+
+    for _ in range(count):
+        threading.Thread(target=loop, daemon=True).start()
+
+
+def run(items, read, transform, write, readers=4, transformers=None, writers=4,
+        depths=(16, 16, 16), executor=None):
+    """Pushes items through a read -> transform -> write pipeline.
+
+    read(item) and write(item, data) run on thread pools of readers and
+    writers, so storage latency overlaps with CPU work. transform(data) runs
+    on transformers threads, or in executor (e.g. a ProcessPoolExecutor) when
+    one is given, in which case transform and its data must be picklable.
+    The stages are linked by queues bounded by depths (before reading, before
+    transforming, before writing): a slow stage makes the ones in front of it
+    wait instead of piling data up in memory.
+
+    Yields (item, write result, error) for each item as it completes; error
+    is None unless one of the stages raised for that item.
+    """
+    if transformers is None:
+        transformers = os.cpu_count()
+    if executor is None:
+        cpu = lambda item, data: transform(data)
+    else:
+        cpu = lambda item, data: executor.submit(transform, data).result()
+
+    to_read, to_transform, to_write = (queue.Queue(maxsize=depth) for depth in depths)
+    results = queue.Queue()
+    _stage(readers, to_read, to_transform, lambda item, _: read(item), results)
+    _stage(transformers, to_transform, to_write, cpu, results)
+    _stage(writers, to_write, results, write, results)
+
+    def feed():
+        try:
+            for item in items:
+                to_read.put((item, None, None))
+        finally:
+            to_read.put(STOP)
+
+    threading.Thread(target=feed, daemon=True).start()
+    while True:
+        entry = results.get()
+        if entry is STOP:
+            break
+        yield entry
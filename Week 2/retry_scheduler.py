@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+from concurrent.futures import Future, ThreadPoolExecutor
+from urllib.parse import urlsplit
+import collections
+import heapq
+import itertools
+import math
+import random
+import threading
+import time
+
+# response statuses meaning the backend is overloaded or briefly down:
+retry_statuses = (429, 500, 502, 503, 504)
+
+
+class RetryScheduler:
+    """Runs HTTP calls with retries, per-host concurrency limits & a circuit breaker.
+
+    submit() works like Executor.submit() with the target url in front, and
+    returns a Future for the call's final result. A call that raises OSError
+    (connection errors & timeouts included) or returns a response with a
+    retry status goes back on a delay queue with jittered exponential
+    backoff, so it never holds up calls that are doing fine. After
+    failure_threshold failures in a row the breaker opens & nothing is sent
+    for cooldown seconds; then a single probe call decides whether sending
+    resumes or the breaker opens again.
+
+    on_attempt, if given, is called with (result, error) after every attempt,
+    retried ones included, from the thread that made it.
+    """
+
+    def __init__(self, workers=8, host_limit=4, max_attempts=5, base_delay=0.5,
+                 max_delay=30.0, failure_threshold=5, cooldown=10.0, on_attempt=None):
+        self.host_limit = host_limit
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.on_attempt = on_attempt
+        self.stats = collections.Counter()
+
+        self._cond = threading.Condition()
+        self._ready = collections.defaultdict(collections.deque)  # host -> calls to send
+        self._delayed = []  # heap of (due, seq, call, attempt) waiting out a backoff
+        self._seq = itertools.count()
+        self._in_flight = collections.Counter()
+        self._failures = 0
+        self._open_until = 0.0
+        self._probing = False
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def submit(self, url, fn, *args, **kwargs):
+        """Schedules fn(*args, **kwargs) against url's host, returns its Future."""
+        future = Future()
+        call = (future, urlsplit(url).netloc, fn, args, kwargs)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot submit to a closed scheduler")
+            self._ready[call[1]].append((call, 1))
+            self._cond.notify_all()
+        return future
+
+    def close(self):
+        """Waits for every submitted call to finish, then stops the workers."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._dispatcher.join()
+        self._pool.shutdown()
+
+    def _pending(self):
+        return (any(self._ready.values()) or self._delayed
+                or sum(self._in_flight.values()))
+
+    def _dispatch(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    due, seq, call, attempt = heapq.heappop(self._delayed)
+                    self._ready[call[1]].append((call, attempt))
+                if self._launch(now):
+                    continue
+                if self._closed and not self._pending():
+                    return
+                wake = self._delayed[0][0] if self._delayed else math.inf
+                if self._open_until > now:
+                    wake = min(wake, self._open_until)
+                self._cond.wait(None if wake == math.inf else wake - now)
+
+    def _launch(self, now):
+        """Sends one ready call if the breaker & its host allow, returns whether it did."""
+        if now < self._open_until:
+            return False
+        half_open = self._failures >= self.failure_threshold
+        if half_open and self._probing:
+            return False
+        for host, calls in self._ready.items():
+            if calls and self._in_flight[host] < self.host_limit:
+                call, attempt = calls.popleft()
+                self._in_flight[host] += 1
+                if half_open:
+                    self._probing = True
+                self._pool.submit(self._attempt, call, attempt, half_open)
+                return True
+        return False
+
+    def _attempt(self, call, attempt, probe):
+        future, host, fn, args, kwargs = call
+        result = error = None
+        try:
+            result = fn(*args, **kwargs)
+            failed = getattr(result, "status_code", None) in retry_statuses
+        except OSError as e:
+            error, failed = e, True
+        except Exception as e:
+            error, failed = e, False
+        if self.on_attempt:
+            self.on_attempt(result, error)
+
+        with self._cond:
+            self._in_flight[host] -= 1
+            # NOTE: only the probe's own result lets another call through half-open,
+            # calls already in flight when the breaker opened don't:
+            if probe:
+                self._probing = False
+            self.stats["attempts"] += 1
+            if failed:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    now = time.monotonic()
+                    # a trip is the breaker opening from closed or half-open, not a
+                    # failure while it's already open:
+                    if now >= self._open_until:
+                        self.stats["breaker_trips"] += 1
+                    self._open_until = now + self.cooldown
+            elif error is None:
+                self._failures = 0
+                self._open_until = 0.0
+            retry = failed and attempt < self.max_attempts
+            if retry:
+                # full jitter keeps retries from arriving in lockstep:
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+                heapq.heappush(self._delayed, (time.monotonic() + delay, next(self._seq), call, attempt + 1))
+                self.stats["retries"] += 1
+            elif failed:
+                self.stats["gave_up"] += 1
+            self._cond.notify_all()
+
+        if retry:
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
@@ -1,12 +1,37 @@
 #!/usr/bin/env python3
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+import asyncio
 import os
 import requests
+import retry_scheduler
+import upload_metrics
 
 # set source dir for feedback file:
 src_dir = "feedback/"
 
-# capture list of files:
-files = os.listdir(src_dir)
+# set host url:
+url = "http://localhost/feedback/"
+
+# set batching (0 posts one entry per request; N posts N entries as one JSON
+# array to the bulk url, falling back to one per request if it's rejected):
+batch_size = 0
+bulk_url = "http://localhost/feedback/bulk/"
+# cleared once the server shows it has no bulk endpoint:
+bulk_supported = True
+
+# set upload concurrency (entries in flight over pooled keep-alive connections):
+parallel = 8
+
+# set retries (failed posts are retried with backoff while the rest carry on,
+# & posting pauses while the server keeps failing; see retry_scheduler.py):
+max_attempts = 5
+
+# set where the run's metrics report (JSON) is written:
+report_file = "upload-metrics.json"
+
+# set feedback entry fields, one per line of a feedback file:
+keys = ["title", "name", "date", "feedback"]
 
 # function to read file lines into list:
 def readlines(file):
@@ -15,20 +40,108 @@ def readlines(file):
     return lines
 
 
-# load feedback entries into dictionary:
-feedback = []
-keys = ["title", "name", "date", "feedback"]
-for file in files:
-    lines = readlines(file)
-    feedback.append(dict(zip(keys, lines)))
+# function to build a keep-alive session with a connection per worker:
+def make_session(pool_size):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# function to post an entry, returning the records the server accepted (the
+# scheduler hands every attempt's response to the metrics):
+def post(scheduler, session, entry):
+    try:
+        response = scheduler.submit(url, session.post, url, data=entry).result()
+    except requests.RequestException:
+        return 0
+    return 1 if response.ok else 0
+
+
+# function to post a batch of entries, returning the records the server accepted:
+def post_batch(scheduler, session, batch):
+    global bulk_supported
+    if batch_size and bulk_supported:
+        try:
+            response = scheduler.submit(bulk_url, session.post, bulk_url, json=batch).result()
+            if response.ok:
+                return len(batch)
+            if response.status_code in (404, 405, 501):
+                bulk_supported = False
+        except requests.RequestException:
+            pass
+    # bulk rejected, fall back to posting each entry on its own:
+    return sum(post(scheduler, session, entry) for entry in batch)
+
+
+# function to yield feedback file names as the directory is read:
+def list_files():
+    with os.scandir(src_dir) as entries:
+        for entry in entries:
+            if entry.is_file():
+                yield entry.name
+
+
+# coroutine to stream feedback files into posts, with at most window in flight:
+async def ingest(scheduler, session, metrics, window):
+    in_flight = asyncio.Semaphore(window)
+    uploads = set()
+
+    async def upload(batch):
+        try:
+            metrics.delivered(await asyncio.to_thread(post_batch, scheduler, session, batch))
+        finally:
+            in_flight.release()
+
+    async def send(batch):
+        await in_flight.acquire()
+        task = asyncio.create_task(upload(batch))
+        uploads.add(task)
+        task.add_done_callback(uploads.discard)
+        return task
+
+    # each batch is posted as soon as its files are parsed; reading pauses
+    # while the window is full, so memory doesn't grow with the backlog. the
+    # first batch goes alone, so a server without bulk posts rejects just
+    # that one before the rest are posted one entry at a time:
+    first = None
+    batch = []
+    for file in list_files():
+        lines = await asyncio.to_thread(readlines, file)
+        batch.append(dict(zip(keys, lines)))
+        if len(batch) >= max(1, batch_size):
+            if first:
+                await first
+            task = await send(batch)
+            first = first or task
+            batch = []
+    if batch:
+        if first:
+            await first
+        await send(batch)
+    await asyncio.gather(*uploads)
+
+
+async def run(scheduler, session, metrics, window):
+    # size the thread pool for a full window of posts plus the file reader:
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=window + 1))
+    await ingest(scheduler, session, metrics, window)
+
+
+def main():
+    session = make_session(parallel)
+    metrics = upload_metrics.UploadMetrics()
+    with retry_scheduler.RetryScheduler(workers=parallel, host_limit=parallel,
+                                        max_attempts=max_attempts,
+                                        on_attempt=metrics.attempt) as scheduler:
+        asyncio.run(run(scheduler, session, metrics, parallel))
+    stats = scheduler.stats
+    metrics.finish(report_file, retries=stats["retries"], gave_up=stats["gave_up"],
+                   breaker_trips=stats["breaker_trips"])
+    print(f"  retries {stats['retries']}, gave up {stats['gave_up']}, "
+          f"breaker trips {stats['breaker_trips']}")
 
-# set host url:
-url = "http://localhost/feedback/"
 
-# post feedback entries:
-for entry in feedback:
-    response = requests.post(url, data=entry)
-    if response.ok:
-        print("loaded entry")
-    else:
-        print(f"load entry error: {response.status_code}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,37 @@
 #!/usr/bin/env python3
 
+import heapq
 import json
-import locale
+import re
 import sys
 import emails
 import reports
 import os
+import cube_cache
+import monthly_store
+import prices
+import queries
+import sales_table
+
+
+# best sellers listed in the report:
+TOP_N = 10
+
+# analyze the sales as typed columns with numpy, when it's installed:
+COLUMNAR = True
+
+# where results are cached, keyed by the input's content & TOP_N, & how many
+# inputs' results are kept (an empty dir turns the cache off):
+CUBE_CACHE = cube_cache.user_cache_dir("car-sales")
+CUBE_CACHE_KEEP = 8
+
+# where each month's results are kept when a month is given, so year-to-date
+# & rolling summaries come from them rather than from older exports:
+MONTHLY_STORE = monthly_store.user_data_dir(os.path.join("car-sales", "months"))
+ROLLING_MONTHS = 3
+
+# JSON whitespace, skipped between the elements of an array:
+WHITESPACE = re.compile(r"[ \t\n\r]*")
 
 
 def load_data(filename):
@@ -15,68 +41,306 @@ def load_data(filename):
   return data
 
 
+def iter_json_array(json_file, chunk_size=2 ** 16):
+  """Yields the elements of the JSON array in json_file one at a time.
+
+  The file is read chunk_size characters at a time, so only the current
+  chunk and the element being decoded are held in memory, however long the
+  array is.
+  """
+  decoder = json.JSONDecoder()
+  buffer, pos, eof = "", 0, False
+  state = "open"  # then "first" element, "next" separator or a "value" after one
+  while True:
+    pos = WHITESPACE.match(buffer, pos).end()
+    if pos < len(buffer):
+      char = buffer[pos]
+      if state == "open":
+        if char != "[":
+          raise ValueError("expected a JSON array")
+        pos, state = pos + 1, "first"
+        continue
+      if char == "]" and state in ("first", "next"):
+        return
+      if state == "next":
+        if char != ",":
+          raise ValueError("expected ',' or ']' between JSON array elements")
+        pos, state = pos + 1, "value"
+        continue
+      try:
+        value, end = decoder.raw_decode(buffer, pos)
+      except json.JSONDecodeError:
+        if eof:
+          raise
+      else:
+        # a value not yet followed by a delimiter (e.g. a number cut off at
+        # the end of the chunk) may go on in the next one:
+        if eof or (end < len(buffer) and buffer[end] in " \t\n\r,]"):
+          yield value
+          pos, state = end, "next"
+          continue
+    elif eof:
+      raise ValueError("unexpected end of JSON array")
+    # read on, dropping the text already decoded:
+    chunk = json_file.read(chunk_size)
+    eof = not chunk
+    buffer, pos = buffer[pos:] + chunk, 0
+
+
+def iter_json_lines(json_file):
+  """Yields the JSON value on each non-blank line of json_file."""
+  for line in json_file:
+    if line.strip():
+      yield json.loads(line)
+
+
+def iter_data(filename):
+  """Yields the records in filename one at a time.
+
+  Files ending in .jsonl or .ndjson are read as JSON Lines, anything else as
+  a JSON array like load_data() takes.
+  """
+  with open(filename) as json_file:
+    if filename.endswith((".jsonl", ".ndjson")):
+      yield from iter_json_lines(json_file)
+    else:
+      yield from iter_json_array(json_file)
+
+
 def format_car(car):
   """Given a car dictionary, returns a nicely formatted name."""
   return "{} {} ({})".format(
       car["car_make"], car["car_model"], car["car_year"])
 
 
-def process_data(data):
-  """Analyzes the data, looking for maximums.
+class MaxBy:
+  """Keeps the first record with the largest key(record), and that key."""
 
-  Returns a list of lines that summarize the information.
+  def __init__(self, key):
+    self.key = key
+    self.best = None
+    self.item = None
+
+  def add(self, item):
+    value = self.key(item)
+    if self.best is None or value > self.best:
+      self.best, self.item = value, item
+
+  def result(self):
+    return self.best, self.item
+
+
+class SumBy:
+  """Totals value(record) per group(record)."""
+
+  def __init__(self, group, value):
+    self.group = group
+    self.value = value
+    self.totals = {}
+
+  def add(self, item):
+    group = self.group(item)
+    self.totals[group] = self.totals.get(group, 0) + self.value(item)
+
+  def result(self):
+    return self.totals
+
+
+class TopN:
+  """Keeps the n records with the largest key(record) on a heap, earliest first on ties."""
+
+  def __init__(self, n, key):
+    self.n = n
+    self.key = key
+    self.heap = []
+    self.seen = 0
+
+  def add(self, item):
+    # the heap's root is the entry to drop next: the smallest key, latest seen:
+    entry = (self.key(item), -self.seen, item)
+    self.seen += 1
+    if len(self.heap) < self.n:
+      heapq.heappush(self.heap, entry)
+    elif entry[:2] > self.heap[0][:2]:
+      heapq.heapreplace(self.heap, entry)
+
+  def result(self):
+    return [(value, item) for value, _, item in sorted(self.heap, key=lambda e: e[:2], reverse=True)]
+
+
+class Rows:
+  """Collects row(record) for every record."""
+
+  def __init__(self, row):
+    self.row = row
+    self.rows = []
+
+  def add(self, item):
+    self.rows.append(self.row(item))
+
+  def result(self):
+    return self.rows
+
+
+def aggregate(data, aggregators):
+  """Feeds every record in data to each aggregator, in a single pass.
+
+  aggregators maps names to objects with add(record) and result(); returns
+  their results under the same names. A new statistic is one more
+  aggregator, not another pass over the data.
   """
-  curr = locale.getdefaultlocale()
-  locale.setlocale(locale.LC_ALL, curr)
-  max_revenue = {"revenue": 0}
-  max_sales = {"total_sales": 0}
-  car_years = {}
   for item in data:
-    # Calculate the revenue generated by this model (price * total_sales)
-    # We need to convert the price from "$1234.56" to 1234.56
-    item_price = locale.atof(item["price"].strip("$"))  # get the item price
-    item_revenue = item["total_sales"] * item_price  # calculate the item revenue
-    if item_revenue > max_revenue["revenue"]: # if item revenue is greater than current max revenue
-      item["revenue"] = item_revenue  # set the item revenue to the current car's revenue
-      max_revenue = item  # set the new max revenue to the current car
-    # TODO: also handle max sales / Calculate the car model which had the most sales
-    if item["total_sales"] > max_sales["total_sales"]:
-      max_sales = item
-    # TODO: also handle most popular car_year
-    year = item["car"]["car_year"]
-    if year not in car_years:
-      car_years[year] = item["total_sales"]
-    else:
-      car_years[year] += item["total_sales"]
+    for aggregator in aggregators.values():
+      aggregator.add(item)
+  return {name: aggregator.result() for name, aggregator in aggregators.items()}
 
-  popular_year_count, popular_year = max(zip(car_years.values(), car_years.keys()))  # get the most popular car year
 
-  summary = [
-    "The {} generated the most revenue: ${}".format(
-      format_car(max_revenue["car"]), max_revenue["revenue"]),
-    "The {} had the most sales: {}".format(format_car(max_sales["car"]), max_sales["total_sales"]),
+def item_revenue(item):
+  """Returns the revenue generated by a model (price * total_sales), in cents."""
+  # We need to convert the price from "$1234.56" to 123456 cents
+  return item["total_sales"] * prices.to_cents(item["price"])
+
+
+def table_row(item):
+  """Turns a record into a row of the report table."""
+  return [item["id"], format_car(item["car"]), item["price"], item["total_sales"]]
+
+
+def summary_aggregators():
+  """Returns the aggregators behind the summary lines, by name."""
+  return {
+    "max_revenue": MaxBy(item_revenue),
+    "max_sales": MaxBy(lambda item: item["total_sales"]),
+    "year_sales": SumBy(lambda item: item["car"]["car_year"], lambda item: item["total_sales"]),
+  }
+
+
+def summarize(results):
+  """Turns the results of summary_aggregators() into lines of text."""
+  revenue, max_revenue = results["max_revenue"]
+  total_sales, max_sales = results["max_sales"]
+  car_years = results["year_sales"]
+  popular_year_count, popular_year = max(zip(car_years.values(), car_years.keys()))  # get the most popular car year
+  return [
+    "The {} generated the most revenue: {}".format(
+      format_car(max_revenue["car"]), prices.format_cents(revenue)),
+    "The {} had the most sales: {}".format(format_car(max_sales["car"]), total_sales),
     "The most popular year was {} with {} sales".format(popular_year, popular_year_count)
   ]
 
-  return summary
+
+def report_queries():
+  """Returns the extra rankings in the report, by title, as fresh queries."""
+  return {
+    "Top {} makes by revenue".format(TOP_N): queries.Query(
+      ("make",), {"revenue": ("sum", "revenue"), "sales": ("sum", "total_sales")},
+      top=("revenue", TOP_N)),
+  }
+
+
+def format_query(title, query, rows):
+  """Turns the rows a query returned into lines of text under title."""
+  lines = ["{}:".format(title)]
+  for rank, row in enumerate(rows, 1):
+    group = " ".join(str(row[key]) for key in query.group_by)
+    values = []
+    for name, (function, field) in query.aggregates.items():
+      value = row[name]
+      if field in ("price", "revenue") and function != "count":
+        value = prices.format_cents(round(value))
+      elif isinstance(value, float):
+        value = "{:.2f}".format(value)
+      values.append("{} {}".format(name, value))
+    lines.append("{}. {}: {}".format(rank, group, ", ".join(values)))
+  return lines
+
+
+def process_data(data):
+  """Analyzes the data, looking for maximums.
+
+  Returns a list of lines that summarize the information.
+  """
+  return summarize(aggregate(data, summary_aggregators()))
 
 
 def cars_dict_to_table(car_data):
-  """Turns the data in car_data into a list of lists."""
+  """Turns the data in car_data (any iterable of records) into a list of lists."""
   table_data = [["ID", "Car", "Price", "Total Sales"]]
   for item in car_data:
-    table_data.append([item["id"], format_car(item["car"]), item["price"], item["total_sales"]])
+    table_data.append(table_row(item))
   return table_data
 
+
+def span_lines(title, results, missing):
+  """Summarizes results rolled up over several months, under title."""
+  totals = queries.Query((), {"revenue": ("sum", "revenue"), "sales": ("sum", "total_sales")})
+  total = totals.rollup(results["cube"])[0]
+  lines = ["{}:".format(title)] + summarize(results)
+  lines.append("In total {} was made from {} sales".format(
+    prices.format_cents(total["revenue"]), total["sales"]))
+  if missing:
+    lines.append("(nothing stored for {})".format(", ".join(missing)))
+  return lines
+
+
+def analyze(filename):
+  """Reads filename once, returns everything the report is built from.
+
+  That's the summary_aggregators() results, the top sellers, the table rows
+  and a queries.Cube for the rankings.
+  """
+  if COLUMNAR and sales_table.np is not None:
+    # records are parsed once into columns, then analyzed a column at a time:
+    columns = sales_table.load(iter_data(filename))
+    results = sales_table.summary_results(columns)
+    results["top_sales"] = sales_table.top_n(columns, TOP_N)
+    results["table"] = [table_row(item) for item in sales_table.records(columns)]
+    results["cube"] = sales_table.cube(columns)
+    return results
+  # records are streamed from the file in a single pass that computes the
+  # summary, the best sellers, the table rows & the cube together:
+  aggregators = summary_aggregators()
+  aggregators["top_sales"] = TopN(TOP_N, lambda item: item["total_sales"])
+  aggregators["table"] = Rows(table_row)
+  aggregators["cube"] = queries.Cube()
+  return aggregate(iter_data(filename), aggregators)
+
+
 def main(argv):
-  """Process the JSON data and generate a full report out of it."""
-  data = load_data("car_sales.json")
-  #TODO Sort the data by total sales
-  sorted_data = sorted(data, key = lambda i: i['total_sales'], reverse=True)  # sort by total sales, descending
-  summary = process_data(data)
+  """Process the JSON data and generate a full report out of it.
+
+  Usage: cars.py [car_sales.json [YYYY-MM]]. Given the month the export
+  covers, its results are stored and the report adds year-to-date and
+  rolling summaries ending with that month.
+  """
+  filename = argv[1] if len(argv) > 1 else "car_sales.json"
+  month = argv[2] if len(argv) > 2 else None
+  results = None
+  if CUBE_CACHE:
+    # rerunning on the same input loads its results instead of re-reading it:
+    key = cube_cache.entry_key(cube_cache.file_digest(filename), TOP_N)
+    results = cube_cache.load(CUBE_CACHE, key)
+  if results is None:
+    results = analyze(filename)
+    if CUBE_CACHE:
+      cube_cache.store(CUBE_CACHE, key, results)
+      cube_cache.prune(CUBE_CACHE, CUBE_CACHE_KEEP)
+  summary = summarize(results)
   # TODO: turn this into a PDF report
-  table_data = cars_dict_to_table(data)
-  text_summary = '<br/>\n'.join(summary)
+  table_data = [["ID", "Car", "Price", "Total Sales"]] + results["table"]
+  ranking_lines = ["Top {} by total sales:".format(TOP_N)] + [
+    "{}. {}: {}".format(rank, format_car(item["car"]), total_sales)
+    for rank, (total_sales, item) in enumerate(results["top_sales"], 1)]
+  for title, query in report_queries().items():
+    ranking_lines += format_query(title, query, query.rollup(results["cube"]))
+  if month:
+    # store this month once, then roll up the stored months ending with it:
+    monthly_store.add_month(MONTHLY_STORE, month, results)
+    ranking_lines += span_lines("Year to date through {}".format(month),
+                                *monthly_store.year_to_date(MONTHLY_STORE, month, TOP_N))
+    ranking_lines += span_lines("Last {} months through {}".format(ROLLING_MONTHS, month),
+                                *monthly_store.rolling(MONTHLY_STORE, month, ROLLING_MONTHS, TOP_N))
+  text_summary = '<br/>\n'.join(summary + ranking_lines)
   print(text_summary)
   reports.generate("/tmp/cars.pdf", "A Complete Summary of Monthly Car Sales", text_summary, table_data)
   # TODO: send the PDF report as an email attachment
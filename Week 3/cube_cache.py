@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+import hashlib
+import os
+import pickle
+
+# bumped whenever what's cached changes shape, so old entries stop matching:
+CACHE_VERSION = 1
+
+
+def user_cache_dir(name):
+  """Returns the directory called name in the user's cache directory
+  ($XDG_CACHE_HOME, else ~/.cache)."""
+  base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+  return os.path.join(base, name)
+
+
+def private_dir(path):
+  """Creates the directory path (mode 0700) unless it exists, returns path.
+
+  Pickles run code as they load, so raises PermissionError if path belongs
+  to another user or others can write to it.
+  """
+  os.makedirs(path, mode=0o700, exist_ok=True)
+  info = os.stat(path)
+  if info.st_uid != os.getuid() or info.st_mode & 0o022:
+    raise PermissionError("{} isn't private to this user, won't load pickles from it".format(path))
+  return path
+
+
+def file_digest(filename):
+  """Returns the sha256 of filename's contents, read a block at a time."""
+  sha = hashlib.sha256()
+  with open(filename, "rb") as f:
+    for block in iter(lambda: f.read(2 ** 20), b""):
+      sha.update(block)
+  return sha.hexdigest()
+
+
+def entry_key(digest, *params):
+  """Returns the key of the entry for an input with this digest, analyzed with
+  params (whatever else the results depend on, like the top-N size)."""
+  text = "|".join([digest] + [repr(param) for param in params])
+  return hashlib.sha256(text.encode()).hexdigest()
+
+
+def entry_path(cache_dir, key, part):
+  """Returns the file holding one part ("cube" or "table") of an entry."""
+  return os.path.join(cache_dir, "v{}-{}.{}.pickle".format(CACHE_VERSION, key, part))
+
+
+def read_pickle(path):
+  """Returns the value pickled in path, or None if there's no such file.
+
+  Raises PermissionError if the file belongs to another user or others can
+  write to it.
+  """
+  try:
+    with open(path, "rb") as f:
+      info = os.fstat(f.fileno())
+      if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        raise PermissionError("{} isn't private to this user, won't load it".format(path))
+      return pickle.load(f)
+  except FileNotFoundError:
+    return None
+
+
+def write_pickle(path, value):
+  """Pickles value into path, via a temporary file & rename so readers never
+  see half of it."""
+  tmp = "{}.{}.tmp".format(path, os.getpid())
+  with open(tmp, "wb") as f:
+    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+  os.replace(tmp, path)
+
+
+def load(cache_dir, key, table=True):
+  """Returns the results cached under key, or None.
+
+  The table rows are kept apart from the (small) cube and summary results,
+  so a caller that doesn't need them (table=False) loads in milliseconds
+  however big the input was.
+  """
+  private_dir(cache_dir)
+  results = read_pickle(entry_path(cache_dir, key, "cube"))
+  if results is None:
+    return None
+  if table:
+    rows = read_pickle(entry_path(cache_dir, key, "table"))
+    if rows is None:
+      return None
+    results["table"] = rows
+  os.utime(entry_path(cache_dir, key, "cube"))  # marks the entry recently used
+  return results
+
+
+def store(cache_dir, key, results):
+  """Caches results under key, table rows apart."""
+  private_dir(cache_dir)
+  results = dict(results)
+  rows = results.pop("table")
+  # NOTE: the table goes first, so a cube on disk always has its table:
+  write_pickle(entry_path(cache_dir, key, "table"), rows)
+  write_pickle(entry_path(cache_dir, key, "cube"), results)
+
+
+def prune(cache_dir, keep):
+  """Deletes all but the keep most recently used entries, returns how many went."""
+  try:
+    names = os.listdir(cache_dir)
+  except FileNotFoundError:
+    return 0
+  cubes = [os.path.join(cache_dir, name) for name in names if name.endswith(".cube.pickle")]
+  cubes.sort(key=os.path.getmtime, reverse=True)
+  for cube in cubes[keep:]:
+    for path in (cube, cube[:-len(".cube.pickle")] + ".table.pickle"):
+      try:
+        os.remove(path)
+      except FileNotFoundError:
+        pass
+  return len(cubes[keep:])
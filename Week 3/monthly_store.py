@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+import heapq
+import os
+import re
+import cube_cache
+
+# months are named like "2023-07":
+MONTH = re.compile(r"(\d{4})-(0[1-9]|1[0-2])")
+
+# The store is a directory with one file per month, holding that month's
+# partial results: the cars.analyze() results without the table rows. Every
+# part of them merges across months (maximums, sums, top-N lists and cube
+# cells), so any span of months is answered from the stored partials alone.
+# Like cube_cache's, the store must be private to the user, since pickles
+# run code as they load.
+
+
+def user_data_dir(name):
+  """Returns the directory called name in the user's data directory
+  ($XDG_DATA_HOME, else ~/.local/share), which unlike /tmp lasts across
+  reboots."""
+  base = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+  return os.path.join(base, name)
+
+
+def month_path(store_dir, month):
+  """Returns the file holding a month's partial results."""
+  if not MONTH.fullmatch(month):
+    raise ValueError("not a month like 2023-07: {!r}".format(month))
+  return os.path.join(store_dir, "{}.pickle".format(month))
+
+
+def add_month(store_dir, month, results):
+  """Stores a month's results (the table rows are left out), replacing any
+  stored for that month before."""
+  cube_cache.private_dir(store_dir)
+  partial = {name: value for name, value in results.items() if name != "table"}
+  cube_cache.write_pickle(month_path(store_dir, month), partial)
+
+
+def stored_months(store_dir):
+  """Returns the months in the store, oldest first."""
+  try:
+    names = os.listdir(store_dir)
+  except FileNotFoundError:
+    return []
+  return sorted(name[:-len(".pickle")] for name in names
+                if name.endswith(".pickle") and MONTH.fullmatch(name[:-len(".pickle")]))
+
+
+def months_back(month, count):
+  """Returns count months ending with month, oldest first."""
+  year, number = (int(part) for part in MONTH.fullmatch(month).groups())
+  index = year * 12 + number - 1
+  return ["{}-{:02d}".format(i // 12, i % 12 + 1) for i in range(index - count + 1, index + 1)]
+
+
+def merge(partials, top_n):
+  """Combines months' partial results, oldest first, into results for the
+  whole span.
+
+  Ties go to the earliest month, as they would scanning the months' records
+  in order.
+  """
+  merged = {"max_revenue": (None, None), "max_sales": (None, None), "year_sales": {}, "cube": {}}
+  top_sales = []
+  for month, partial in enumerate(partials):
+    for name in ("max_revenue", "max_sales"):
+      value, item = partial[name]
+      if merged[name][0] is None or value > merged[name][0]:
+        merged[name] = (value, item)
+    for year, total in partial["year_sales"].items():
+      merged["year_sales"][year] = merged["year_sales"].get(year, 0) + total
+    for rank, (total_sales, item) in enumerate(partial["top_sales"]):
+      top_sales.append((total_sales, -month, -rank, item))
+    for cell_key, cell in partial["cube"].items():
+      merged_cell = merged["cube"].setdefault(cell_key, {field: [0, 0, None] for field in cell})
+      for field, (total, count, largest) in cell.items():
+        state = merged_cell[field]
+        state[0] += total
+        state[1] += count
+        if state[2] is None or largest > state[2]:
+          state[2] = largest
+  merged["top_sales"] = [(total_sales, item) for total_sales, _, _, item in
+                         heapq.nlargest(top_n, top_sales, key=lambda entry: entry[:3])]
+  return merged
+
+
+def rollup(store_dir, months, top_n):
+  """Merges the stored partials of months, returns (results, months missing
+  from the store)."""
+  cube_cache.private_dir(store_dir)
+  stored = set(stored_months(store_dir))
+  missing = [month for month in months if month not in stored]
+  partials = [cube_cache.read_pickle(month_path(store_dir, month))
+              for month in months if month in stored]
+  return (merge(partials, top_n) if partials else None), missing
+
+
+def year_to_date(store_dir, month, top_n):
+  """Rolls up January through month of month's year."""
+  return rollup(store_dir, months_back(month, int(month[5:])), top_n)
+
+
+def rolling(store_dir, month, window, top_n):
+  """Rolls up the window months ending with month."""
+  return rollup(store_dir, months_back(month, window), top_n)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import functools
+import re
+
+# a price like "$1234.56", "$1,234.5" or "12": dollars, then up to two
+# digits of cents:
+PRICE = re.compile(r"\s*(-?)\$?(\d{1,3}(?:,\d{3})+|\d+)(?:\.(\d{0,2}))?\s*")
+
+
+@functools.lru_cache(maxsize=2 ** 16)
+def to_cents(price):
+  """Converts a price string like "$1,234.56" into integer cents, exactly.
+
+  Unlike locale.atof this doesn't depend on (or change) the process locale,
+  and results are cached, since exports repeat the same prices many times.
+  Raises ValueError for anything that isn't a price.
+  """
+  match = PRICE.fullmatch(price)
+  if not match:
+    raise ValueError("not a price: {!r}".format(price))
+  sign, dollars, cents = match.groups()
+  value = int(dollars.replace(",", "")) * 100 + int((cents or "").ljust(2, "0"))
+  return -value if sign else value
+
+
+def all_to_cents(prices):
+  """Converts every price string in prices (any iterable), returns a list of
+  integer cents."""
+  return list(map(to_cents, prices))
+
+
+def format_cents(cents):
+  """Formats integer cents as a price string like "$1234.56"."""
+  sign = "-" if cents < 0 else ""
+  return "{}${}.{:02d}".format(sign, *divmod(abs(cents), 100))
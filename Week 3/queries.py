@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+import heapq
+import prices
+
+# fields a query can group by, and how to read them from a record:
+KEYS = {
+  "make": lambda item: item["car"]["car_make"],
+  "model": lambda item: item["car"]["car_model"],
+  "year": lambda item: item["car"]["car_year"],
+}
+
+# numeric fields a query can aggregate (prices & revenue in cents):
+VALUES = {
+  "year": lambda item: item["car"]["car_year"],
+  "price": lambda item: prices.to_cents(item["price"]),
+  "total_sales": lambda item: item["total_sales"],
+  "revenue": lambda item: item["total_sales"] * prices.to_cents(item["price"]),
+}
+
+FUNCTIONS = ("sum", "count", "mean", "max")
+
+# the finest grouping kept in a Cube:
+CUBE_KEYS = ("make", "model", "year")
+
+
+class Query:
+  """Groups records by some KEYS and aggregates VALUES within each group.
+
+  group_by is a tuple of KEYS names. aggregates maps output names to
+  (function, field) pairs, function being one of FUNCTIONS (field is
+  ignored for count). top, if given, is (output name, n): only the n groups
+  with the largest value of that aggregate are kept, picked with a heap.
+
+  A Query is an aggregator for cars.aggregate(), so any number of queries
+  share a single scan of the records. result() returns a dict per group
+  holding its keys and aggregates, biggest first if top was given, else in
+  the order groups were first seen.
+  """
+
+  def __init__(self, group_by, aggregates, top=None):
+    for key in group_by:
+      if key not in KEYS:
+        raise ValueError("can't group by {!r}".format(key))
+    for function, field in aggregates.values():
+      if function not in FUNCTIONS:
+        raise ValueError("unknown aggregate {!r}".format(function))
+      if function != "count" and field not in VALUES:
+        raise ValueError("can't aggregate {!r}".format(field))
+    if top and top[0] not in aggregates:
+      raise ValueError("top {!r} isn't one of the aggregates".format(top[0]))
+    self.group_by = tuple(group_by)
+    self.aggregates = dict(aggregates)
+    self.top = top
+    self.groups = {}
+    self._keys = [KEYS[key] for key in self.group_by]
+    self._values = [VALUES.get(field) for function, field in self.aggregates.values()]
+
+  def add(self, item):
+    group = tuple(key(item) for key in self._keys)
+    states = self.groups.get(group)
+    if states is None:
+      states = self.groups[group] = [[0, 0, None] for _ in self._values]
+    for state, value in zip(states, self._values):
+      # each aggregate keeps [sum, count, max] of its field:
+      state[1] += 1
+      if value is not None:
+        v = value(item)
+        state[0] += v
+        if state[2] is None or v > state[2]:
+          state[2] = v
+
+  def result(self):
+    return self.rows(self.groups.items())
+
+  def rollup(self, cells):
+    """Answers the query from the cells of a Cube instead of the records."""
+    positions = [CUBE_KEYS.index(key) for key in self.group_by]
+    fields = [field or "total_sales" for function, field in self.aggregates.values()]
+    groups = {}
+    for cell_key, cell in cells.items():
+      group = tuple(cell_key[i] for i in positions)
+      states = groups.get(group)
+      if states is None:
+        states = groups[group] = [[0, 0, None] for _ in fields]
+      for state, field in zip(states, fields):
+        total, count, largest = cell[field]
+        state[0] += total
+        state[1] += count
+        if state[2] is None or largest > state[2]:
+          state[2] = largest
+    return self.rows(groups.items())
+
+  def rows(self, groups):
+    """Turns (group key, [[sum, count, max] per aggregate]) pairs, in the order
+    groups were first seen, into result rows."""
+    rows = []
+    for group, states in groups:
+      row = dict(zip(self.group_by, group))
+      for (name, (function, field)), (total, count, largest) in zip(self.aggregates.items(), states):
+        if function == "sum":
+          row[name] = total
+        elif function == "count":
+          row[name] = count
+        elif function == "mean":
+          row[name] = total / count
+        else:
+          row[name] = largest
+      rows.append(row)
+    if not self.top:
+      return rows
+    name, n = self.top
+    # ties go to the group seen first:
+    ranked = heapq.nlargest(n, enumerate(rows), key=lambda pair: (pair[1][name], -pair[0]))
+    return [row for _, row in ranked]
+
+
+class Cube:
+  """Rolls records up per (make, model, year) cell, keeping [sum, count, max]
+  of every VALUES field.
+
+  result() returns {cell key: {field: [sum, count, max]}}, cells in the
+  order they were first seen. Any Query can be answered from it with
+  Query.rollup(), without going back to the records.
+  """
+
+  def __init__(self):
+    self.cells = {}
+    self._keys = [KEYS[key] for key in CUBE_KEYS]
+
+  def add(self, item):
+    cell_key = tuple(key(item) for key in self._keys)
+    cell = self.cells.get(cell_key)
+    if cell is None:
+      cell = self.cells[cell_key] = {field: [0, 0, None] for field in VALUES}
+    for field, state in cell.items():
+      v = VALUES[field](item)
+      state[0] += v
+      state[1] += 1
+      if state[2] is None or v > state[2]:
+        state[2] = v
+
+  def result(self):
+    return self.cells
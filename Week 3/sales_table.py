@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+import array
+import collections
+import prices
+import queries
+
+try:
+  import numpy as np
+except ImportError:  # the columnar table is optional, cars.py works without it
+  np = None
+
+# A sales table held as one typed array per field. Makes, models and price
+# strings (as written in the export) are stored as codes into the makes,
+# models and prices lists; cents holds each row's price in cents.
+Columns = collections.namedtuple(
+    "Columns", ["ids", "make_codes", "model_codes", "years", "price_codes", "cents", "total_sales",
+                "makes", "models", "prices"])
+
+
+def load(data):
+  """Reads sale records from data (any iterable) into Columns, in one pass.
+
+  Fields are appended to compact arrays as records go by, so the records
+  themselves are never all held at once. Each distinct price string is
+  parsed once, after the pass.
+  """
+  fields = [array.array("q") for _ in range(6)]
+  ids, make_codes, model_codes, years, price_codes, total_sales = fields
+  codes = {}, {}, {}
+  for item in data:
+    car = item["car"]
+    ids.append(item["id"])
+    make_codes.append(codes[0].setdefault(car["car_make"], len(codes[0])))
+    model_codes.append(codes[1].setdefault(car["car_model"], len(codes[1])))
+    years.append(car["car_year"])
+    price_codes.append(codes[2].setdefault(item["price"], len(codes[2])))
+    total_sales.append(item["total_sales"])
+  arrays = [np.frombuffer(field, dtype=np.int64) for field in fields]
+  price_cents = np.array(prices.all_to_cents(codes[2]), dtype=np.int64)
+  return Columns(*arrays[:5], price_cents[arrays[4]], arrays[5],
+                 list(codes[0]), list(codes[1]), list(codes[2]))
+
+
+def record(columns, i):
+  """Rebuilds row i of columns as a sale record."""
+  return {
+    "id": int(columns.ids[i]),
+    "car": {
+      "car_make": columns.makes[columns.make_codes[i]],
+      "car_model": columns.models[columns.model_codes[i]],
+      "car_year": int(columns.years[i]),
+    },
+    "price": columns.prices[columns.price_codes[i]],
+    "total_sales": int(columns.total_sales[i]),
+  }
+
+
+def records(columns):
+  """Yields every row of columns as a sale record, in order."""
+  for i in range(len(columns.ids)):
+    yield record(columns, i)
+
+
+def summary_results(columns):
+  """Computes the results of cars.summary_aggregators() with vectorized operations.
+
+  Revenue is in cents, like the per-record path, and every sum is exact
+  integer arithmetic. Ties go the same way too: the first record with the
+  most revenue or sales, and the latest of equally popular years.
+  """
+  revenue = columns.cents * columns.total_sales
+  top_revenue = int(np.argmax(revenue))
+  top_sales = int(np.argmax(columns.total_sales))
+  first_year = int(columns.years.min())
+  offsets = columns.years - first_year
+  year_totals = np.zeros(int(offsets.max()) + 1, dtype=np.int64)
+  np.add.at(year_totals, offsets, columns.total_sales)
+  return {
+    "max_revenue": (int(revenue[top_revenue]), record(columns, top_revenue)),
+    "max_sales": (int(columns.total_sales[top_sales]), record(columns, top_sales)),
+    "year_sales": {first_year + int(offset): int(year_totals[offset])
+                   for offset in np.flatnonzero(np.bincount(offsets))},
+  }
+
+
+def top_n(columns, n):
+  """Returns [(total sales, record)] for the n best sellers, earliest first on ties.
+
+  Only the rows that can make the cut are sorted, not the whole table.
+  """
+  sales = columns.total_sales
+  if len(sales) > n:
+    cutoff = np.partition(sales, len(sales) - n)[len(sales) - n]
+    rows = np.concatenate([np.flatnonzero(sales > cutoff), np.flatnonzero(sales == cutoff)])
+  else:
+    rows = np.arange(len(sales))
+  rows = rows[np.lexsort((rows, -sales[rows]))][:n]
+  return [(int(sales[i]), record(columns, i)) for i in rows]
+
+
+def key_column(columns, key):
+  """Returns per-row codes for a queries.KEYS field & the key value of each code."""
+  if key == "make":
+    return columns.make_codes, columns.makes
+  if key == "model":
+    return columns.model_codes, columns.models
+  first_year = int(columns.years.min())
+  return columns.years - first_year, range(first_year, int(columns.years.max()) + 1)
+
+
+def value_column(columns, field):
+  """Returns the per-row values of a queries.VALUES field."""
+  if field == "revenue":
+    return columns.cents * columns.total_sales
+  return {"year": columns.years, "price": columns.cents, "total_sales": columns.total_sales}[field]
+
+
+def group_states(columns, group_by, fields):
+  """Groups rows by the queries.KEYS in group_by, vectorized.
+
+  Returns (group key, [[sum, count, max] per field]) pairs in the order
+  groups were first seen; a field of None gets only its count.
+  """
+  # number each row's group, mixing the key codes into one integer:
+  combined = np.zeros(len(columns.ids), dtype=np.int64)
+  keys = []
+  for key in group_by:
+    codes, values = key_column(columns, key)
+    combined = combined * len(values) + codes
+    keys.append((codes, values))
+  _, first_rows, inverse = np.unique(combined, return_index=True, return_inverse=True)
+  inverse = inverse.reshape(-1)
+  groups = len(first_rows)
+  counts = np.bincount(inverse, minlength=groups)
+  states = []
+  for field in fields:
+    if field is None:
+      states.append((None, None))
+      continue
+    values = value_column(columns, field)
+    totals = np.zeros(groups, dtype=np.int64)
+    np.add.at(totals, inverse, values)
+    largest = np.full(groups, np.iinfo(np.int64).min, dtype=np.int64)
+    np.maximum.at(largest, inverse, values)
+    states.append((totals, largest))
+
+  pairs = []
+  for group in np.argsort(first_rows):
+    row = first_rows[group]
+    key = tuple(values[codes[row]] for codes, values in keys)
+    pairs.append((key, [[0, int(counts[group]), None] if totals is None else
+                        [int(totals[group]), int(counts[group]), int(largest[group])]
+                        for totals, largest in states]))
+  return pairs
+
+
+def run_query(columns, query):
+  """Answers a queries.Query with vectorized operations.
+
+  Returns the same rows as feeding every record to the query.
+  """
+  fields = [None if function == "count" else field
+            for function, field in query.aggregates.values()]
+  return query.rows(group_states(columns, query.group_by, fields))
+
+
+def cube(columns):
+  """Builds the same cells as a queries.Cube fed every record, vectorized."""
+  fields = list(queries.VALUES)
+  return {key: dict(zip(fields, states))
+          for key, states in group_states(columns, queries.CUBE_KEYS, fields)}
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from multiprocessing import get_context
+from time import perf_counter
+from PIL import Image
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# the Week 1 icon converter is benchmarked alongside this week's scripts:
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Week 1"))
+
+# set corpus vars:
+# each corpus is generated from a fixed seed, so every run sees the same images:
+corpus_dir = "/tmp/image-benchmark/"
+seed = 1234
+corpora = {
+    "icons": {"count": 200, "size": (256, 256), "mode": "RGBA", "format": "PNG"},
+    "supplier-tiff": {"count": 40, "size": (3000, 2000), "mode": "RGB", "format": "TIFF"},
+    "supplier-jpeg": {"count": 40, "size": (3000, 2000), "mode": "RGB", "format": "JPEG"},
+    "huge-tiff": {"count": 2, "size": (12000, 8000), "mode": "RGB", "format": "TIFF"},
+}
+
+# set benchmarked paths: (corpus, script, mode, settings patched into the script)
+# "convert" times each file's conversion in memory; "main" times one run of the
+# script's main() over a copy of the corpus, scanning, pipeline, manifest or
+# rendition cache & disk writes included; "main-rerun" times a second main()
+# run, once the first has filled the manifest or cache:
+paths = {
+    "icons": ("icons", "convert_images", "convert", {}),
+    "icons-main": ("icons", "convert_images", "main", {}),
+    "icons-main-rerun": ("icons", "convert_images", "main-rerun", {}),
+    "reprocess": ("supplier-tiff", "changeImage", "convert", {}),
+    "reprocess-main": ("supplier-tiff", "changeImage", "main", {}),
+    "reprocess-main-rerun": ("supplier-tiff", "changeImage", "main-rerun", {}),
+    "reprocess-fast-load": ("supplier-jpeg", "changeImage", "convert", {}),
+    "reprocess-full-decode": ("supplier-jpeg", "changeImage", "convert", {"fast_load": False}),
+    "reprocess-multi": ("supplier-tiff", "changeImage", "convert", {"multi_rendition": True}),
+    "reprocess-strips": ("huge-tiff", "changeImage", "convert", {"max_image_mb": 64}),
+}
+
+results_file = "benchmark-results.json"
+
+
+def makeImage(rng, size, mode):
+    """return a reproducible image: a gradient overlaid with coarse noise"""
+    gradient = Image.linear_gradient("L").resize(size).convert(mode)
+    noise_size = (max(1, size[0] // 8), max(1, size[1] // 8))
+    bands = Image.getmodebands(mode)
+    noise = Image.frombytes(mode, noise_size, rng.randbytes(noise_size[0] * noise_size[1] * bands))
+    return Image.blend(gradient, noise.resize(size), 0.3)
+
+
+def makeCorpus(name, spec):
+    """generate corpus name under corpus_dir unless an identical one exists
+
+    returns the list of image files in it.
+    """
+    directory = os.path.join(corpus_dir, name)
+    spec_file = os.path.join(directory, "spec.json")
+    stamp = dict(spec, seed=seed)
+    files = [os.path.join(directory, "{:05d}.{}".format(i, spec["format"].lower()))
+             for i in range(spec["count"])]
+    try:
+        with open(spec_file) as f:
+            if json.load(f) == json.loads(json.dumps(stamp)):
+                return files
+    except FileNotFoundError:
+        pass
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random("{}-{}".format(seed, name))
+    for file in files:
+        makeImage(rng, tuple(spec["size"]), spec["mode"]).save(file, spec["format"])
+    with open(spec_file, "w") as f:
+        json.dump(stamp, f)
+    return files
+
+
+def percentile(values, pct):
+    """return the nearest-rank percentile of values"""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def imageJob(script, settings):
+    """return a function converting one file the way script does, in memory"""
+    if script == "convert_images":
+        import convert_images
+
+        def job(file):
+            with open(file, "rb") as f:
+                convert_images.convert(f.read())
+        return job
+
+    import changeImage
+    for name, value in settings.items():
+        setattr(changeImage, name, value)
+    active = changeImage.activeRenditions()
+    cap = changeImage.max_image_mb * 2 ** 20
+
+    def job(file):
+        # NOTE: mirror readJob, which hands files over the memory cap on as paths:
+        data = file if os.path.getsize(file) > cap else changeImage.readImage(file)
+        changeImage.reprocess(data, active)
+    return job
+
+
+def mainJob(script, settings, files, work_dir):
+    """return a function running script's main() end to end over a copy of files
+
+    sources are linked into work_dir, and outputs, manifest & rendition cache
+    are written under it, so the original corpus is never touched.
+    """
+    src_dir = os.path.join(work_dir, "src")
+    out_dir = os.path.join(work_dir, "out")
+    os.makedirs(src_dir)
+    os.makedirs(out_dir)
+    for file in files:
+        dest = os.path.join(src_dir, os.path.basename(file))
+        try:
+            os.link(file, dest)
+        except OSError:
+            shutil.copyfile(file, dest)
+
+    if script == "convert_images":
+        import convert_images
+        convert_images.directory = src_dir
+        convert_images.output_directory = out_dir
+        convert_images.manifest_path = os.path.join(out_dir, ".manifest.json")
+        module = convert_images
+    else:
+        import changeImage
+        for name, value in settings.items():
+            setattr(changeImage, name, value)
+        # NOTE: changeImage writes renditions next to their sources:
+        changeImage.img_dir = src_dir + "/"
+        changeImage.cache_dir = os.path.join(out_dir, "rendition-cache/")
+        module = changeImage
+
+    def job():
+        # main() may parse the command line, & prints a line per image:
+        sys.argv = [script + ".py"]
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            module.main()
+    return job
+
+
+def peakRss():
+    """return peak RSS in MB of this process or its largest finished child"""
+    peak_rss = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                   resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # NOTE: ru_maxrss is in KB on Linux but bytes on macOS:
+    return peak_rss / 2 ** 20 if sys.platform == "darwin" else peak_rss / 2 ** 10
+
+
+def runPath(name, files):
+    """time files through a path, run in a fresh process for its peak RSS"""
+    corpus, script, mode, settings = paths[name]
+    total_bytes = sum(os.path.getsize(file) for file in files)
+    latencies = []
+    if mode == "convert":
+        job = imageJob(script, settings)
+        start = perf_counter()
+        for file in files:
+            file_start = perf_counter()
+            job(file)
+            latencies.append(perf_counter() - file_start)
+        elapsed = perf_counter() - start
+    else:
+        with tempfile.TemporaryDirectory(prefix="image-benchmark-") as work_dir:
+            job = mainJob(script, settings, files, work_dir)
+            if mode == "main-rerun":
+                job()
+            start = perf_counter()
+            job()
+            elapsed = perf_counter() - start
+
+    return {
+        "path": name,
+        "corpus": corpus,
+        "mode": mode,
+        "images": len(files),
+        "images_per_sec": len(files) / elapsed,
+        "mb_per_sec": total_bytes / 2 ** 20 / elapsed,
+        # a main() run converts images together, so has no per-image latencies:
+        "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 99) * 1000 if latencies else None,
+        "peak_rss_mb": peakRss(),
+    }
+
+
+def formatResult(result):
+    """return one line summing up a path's result"""
+    line = "{path}: {images} images, {images_per_sec:.1f} images/s, {mb_per_sec:.1f} MB/s".format(**result)
+    if result["p50_ms"] is not None:
+        line += ", p50 {p50_ms:.1f}ms, p99 {p99_ms:.1f}ms".format(**result)
+    return line + ", peak RSS {peak_rss_mb:.0f}MB".format(**result)
+
+
+def gitCommit():
+    """return the commit being benchmarked, if run from a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(old, new):
+    """print how each path's numbers moved since an older results file"""
+    old_paths = {r["path"]: r for r in old["results"]}
+    for result in new["results"]:
+        before = old_paths.get(result["path"])
+        if not before:
+            continue
+        changes = ["{} {:+.1%}".format(metric, result[metric] / before[metric] - 1)
+                   for metric in ("images_per_sec", "mb_per_sec", "p50_ms", "p99_ms", "peak_rss_mb")
+                   if before.get(metric) and result.get(metric) is not None]
+        print("{}: {}".format(result["path"], ", ".join(changes)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the image conversion scripts.")
+    parser.add_argument("paths", nargs="*", default=list(paths), metavar="PATH",
+                        help="paths to run (default: all of {})".format(", ".join(paths)))
+    parser.add_argument("-o", "--output", default=results_file,
+                        help="results file to write (default: %(default)s)")
+    parser.add_argument("-c", "--compare", metavar="RESULTS",
+                        help="earlier results file to compare against")
+    args = parser.parse_args()
+    # NOTE: checked here, argparse's choices reject an empty nargs="*" list:
+    unknown = [name for name in args.paths if name not in paths]
+    if unknown:
+        parser.error("unknown path {} (choose from {})".format(", ".join(unknown), ", ".join(paths)))
+
+    report = {
+        "commit": gitCommit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pillow": Image.__version__,
+        "seed": seed,
+        "results": [],
+    }
+    for name in args.paths:
+        corpus = paths[name][0]
+        files = makeCorpus(corpus, corpora[corpus])
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(runPath, name, files).result()
+        report["results"].append(result)
+        print(formatResult(result))
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
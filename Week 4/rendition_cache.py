@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import hashlib
+import os
+import shutil
+import tempfile
+import uuid
+
+
+def makeKey(digest, *params):
+    """return cache key for source content digest & the transform params"""
+    text = "|".join([digest] + [repr(p) for p in params])
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def entryPath(cache_dir, key):
+    """return path of the cache entry for key"""
+    return os.path.join(cache_dir, key[:2], key)
+
+
+def linkOrCopy(src, dest):
+    """place src at dest as a hardlink, or a copy across filesystems
+
+    goes through a temp name, so dest is swapped whole & never shares an inode
+    with a file that is later rewritten in place. the temp name is unique to
+    the call, as writer threads may place the same file at once.
+    """
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        return
+    tmp = "{}.{}.tmp".format(dest, uuid.uuid4().hex)
+    try:
+        os.link(src, tmp)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        # NOTE: copy into a new file of our own, never one a link may share:
+        with open(src, "rb") as src_file:
+            fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(dest) or ".")
+            with os.fdopen(fd, "wb") as tmp_file:
+                shutil.copyfileobj(src_file, tmp_file)
+    os.replace(tmp, dest)
+
+
+def fetch(cache_dir, key, dest):
+    """place cached entry for key at dest, return False on a miss"""
+    entry = entryPath(cache_dir, key)
+    try:
+        linkOrCopy(entry, dest)
+    except FileNotFoundError:
+        return False
+    # mark entry as recently used for LRU eviction:
+    os.utime(entry)
+    return True
+
+
+def store(cache_dir, key, src):
+    """add file src to the cache under key
+
+    an entry already there (stored by another writer from an identical
+    source) is kept as it is.
+    """
+    entry = entryPath(cache_dir, key)
+    os.makedirs(os.path.dirname(entry), exist_ok=True)
+    if os.path.exists(entry):
+        return
+    linkOrCopy(src, entry)
+
+
+def evict(cache_dir, max_bytes):
+    """delete least recently used entries until cache fits in max_bytes
+
+    returns number of entries deleted.
+    """
+    entries = []
+    total = 0
+    for root, dirs, files in os.walk(cache_dir):
+        for name in files:
+            file = os.path.join(root, name)
+            st = os.stat(file)
+            entries.append((st.st_mtime, st.st_size, file))
+            total += st.st_size
+    entries.sort()
+    evicted = 0
+    for mtime, size, file in entries:
+        if total <= max_bytes:
+            break
+        os.remove(file)
+        total -= size
+        evicted += 1
+    return evicted
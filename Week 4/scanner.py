@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+import collections
+import fnmatch
+import os
+
+Entry = collections.namedtuple("Entry", ["path", "size", "mtime"])
+
+
+def matches(name, patterns):
+    """Checks whether name matches any of the glob patterns."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def scan(directory, include=("*",), exclude=(), recursive=False):
+    """Lazily yields an Entry(path, size, mtime) for each file in directory.
+
+    File names are matched against the include and exclude glob patterns.
+    Size and mtime (in nanoseconds) come from the scandir entry, so callers
+    never have to stat the file again. Subdirectories are only walked when
+    recursive is set.
+    """
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if recursive:
+                        pending.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+                if not matches(entry.name, include) or matches(entry.name, exclude):
+                    continue
+                st = entry.stat()
+                yield Entry(entry.path, st.st_size, st.st_mtime_ns)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Local stand-in for the store's upload endpoints, for trying out the uploaders.
+
+Accepts the same posts as the real server (/feedback/, /fruits/, /upload/)
+plus JSON-array bulk posts to /feedback/bulk/ & /fruits/bulk/, and counts
+requests against records received. Images posted to /upload/ are answered
+with an ETag (the sha256 of the file) that HEAD /media/images/<name> returns
+too. GET /stats/ returns the counts as JSON;
+stopping the server (Ctrl-C or SIGTERM) prints how many requests batching
+saved. --fail-rate answers a share of posts with 503, to try out retries.
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import collections
+import email
+import hashlib
+import json
+import random
+import signal
+import sys
+import threading
+
+# set counters shared by the handler threads:
+stats_lock = threading.Lock()
+stats = {"requests": 0, "records": 0, "rejected": 0, "paths": collections.Counter()}
+
+# uploaded images' ETags by file name:
+images = {}
+
+# set by command line options:
+bulk_enabled = True
+max_batch = 0
+fail_rate = 0.0
+
+
+def count(path, records, rejected=False):
+    """record one request & the records accepted from it"""
+    with stats_lock:
+        stats["requests"] += 1
+        stats["records"] += records
+        stats["rejected"] += rejected
+        stats["paths"][path] += 1
+
+
+def summary():
+    """return how many requests were needed per record received"""
+    with stats_lock:
+        requests, records, rejected = stats["requests"], stats["records"], stats["rejected"]
+    line = "received {} records in {} requests, {} rejected".format(records, requests, rejected)
+    if records and requests < records:
+        line += " ({:.0%} fewer than one request per record)".format(1 - requests / records)
+    elif records:
+        line += " ({} more than one request per record)".format(requests - records)
+    return line
+
+
+def uploadedFile(content_type, body):
+    """return (file name, contents) of the first file in a multipart body, or None"""
+    message = email.message_from_bytes(
+        b"Content-Type: " + content_type.encode() + b"\r\n\r\n" + body)
+    if not message.is_multipart():
+        return None
+    for part in message.get_payload():
+        if part.get_filename():
+            return part.get_filename(), part.get_payload(decode=True)
+    return None
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def reply(self, status, body=b"", headers=()):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def readBody(self):
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if not size:
+                    self.rfile.readline()
+                    return body
+                body += self.rfile.read(size)
+                self.rfile.readline()
+        return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+    def do_POST(self):
+        body = self.readBody()
+        if random.random() < fail_rate:
+            count(self.path, 0, rejected=True)
+            return self.reply(503)
+        if self.path in ("/feedback/bulk/", "/fruits/bulk/"):
+            # NOTE: rejected bulk posts still cost a request:
+            if not bulk_enabled:
+                count(self.path, 0, rejected=True)
+                return self.reply(404)
+            batch = json.loads(body)
+            if max_batch and len(batch) > max_batch:
+                count(self.path, 0, rejected=True)
+                return self.reply(413)
+            count(self.path, len(batch))
+            return self.reply(201)
+        if self.path == "/upload/":
+            count(self.path, 1)
+            uploaded = uploadedFile(self.headers.get("Content-Type", ""), body)
+            if not uploaded:
+                return self.reply(201)
+            name, contents = uploaded
+            etag = '"{}"'.format(hashlib.sha256(contents).hexdigest())
+            with stats_lock:
+                images[name] = etag
+            return self.reply(201, headers=[("ETag", etag)])
+        if self.path in ("/feedback/", "/fruits/"):
+            count(self.path, 1)
+            return self.reply(201)
+        self.reply(404)
+
+    def do_HEAD(self):
+        name = self.path[len("/media/images/"):] if self.path.startswith("/media/images/") else ""
+        with stats_lock:
+            etag = images.get(name)
+        if not etag:
+            return self.reply(404)
+        self.reply(200, headers=[("ETag", etag)])
+
+    def do_GET(self):
+        if self.path != "/stats/":
+            return self.reply(404)
+        with stats_lock:
+            body = json.dumps(stats).encode()
+        self.reply(200, body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    global bulk_enabled, max_batch, fail_rate
+    parser = argparse.ArgumentParser(description="Stand-in for the store's upload endpoints.")
+    parser.add_argument("-p", "--port", type=int, default=8000,
+                        help="port to listen on, 0 for any free one (default: %(default)s)")
+    parser.add_argument("--no-bulk", action="store_true",
+                        help="answer bulk posts with 404, as a server without them would")
+    parser.add_argument("--max-batch", type=int, default=0,
+                        help="answer bulk posts of more records than this with 413")
+    parser.add_argument("--fail-rate", type=float, default=0.0,
+                        help="answer this share of posts (0 to 1) with 503")
+    args = parser.parse_args()
+    bulk_enabled, max_batch, fail_rate = not args.no_bulk, args.max_batch, args.fail_rate
+
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), StandInHandler)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print("serving on http://127.0.0.1:{}/".format(server.server_address[1]), flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+from PIL import Image
+
+
+def rawTiles(src_img):
+    """return src_img's tiles as (extents, offset, rawmode, row bytes)
+
+    returns None unless every tile is stored raw & top-down, the only layout
+    whose rows can be located without decoding the ones before them.
+    """
+    tiles = []
+    for codec, extents, offset, args in src_img.tile:
+        if codec != "raw":
+            return None
+        rawmode, stride, orientation = args if isinstance(args, tuple) else (args, 0, 1)
+        if orientation != 1:
+            return None
+        x0, y0, x1, y1 = extents
+        row_bytes = stride or len(Image.new(src_img.mode, (x1 - x0, 1)).tobytes("raw", rawmode))
+        tiles.append((extents, offset, rawmode, row_bytes))
+    return tiles
+
+
+def canDecodeRows(src_img):
+    """check if rows of an opened (not yet loaded) image can be decoded alone"""
+    try:
+        return bool(rawTiles(src_img))
+    except (ValueError, TypeError):
+        return False
+
+
+def loadRows(file, top, bottom):
+    """decode only rows top to bottom of image file
+
+    the returned image is (width, bottom - top); nothing outside those rows
+    is read or held in memory.
+    """
+    src_img = Image.open(file)
+    tiles = []
+    for (x0, y0, x1, y1), offset, rawmode, row_bytes in rawTiles(src_img):
+        first, last = max(y0, top), min(y1, bottom)
+        if first >= last:
+            continue
+        tiles.append(("raw", (x0, first - top, x1, last - top),
+                      offset + (first - y0) * row_bytes, (rawmode, row_bytes, 1)))
+    src_img.tile = tiles
+    # NOTE: the decoder allocates the bitmap at the image's size, so shrink it to the strip:
+    src_img._size = (src_img.width, bottom - top)
+    src_img.load()
+    return src_img
+
+
+def reduceInStrips(file, factor, strip_rows):
+    """decode image file a strip at a time, box-reducing each by factor
+
+    strip_rows is rounded down to a multiple of factor so strip edges line up
+    with the reduction & the result is identical to reducing the whole image.
+    """
+    with Image.open(file) as src_img:
+        width, height = src_img.size
+    strip_rows = max(factor, strip_rows // factor * factor)
+
+    # NOTE: strips spread over Pillow's default 16MB blocks end up on the malloc
+    # heap, which holds on to them after they are freed, so RSS climbs strip
+    # by strip. one block per strip gets its own mapping, returned when freed:
+    block_size = Image.core.get_block_size()
+    strip_bytes = width * strip_rows * 4
+    Image.core.set_block_size(max(block_size, -(-strip_bytes // 4096) * 4096))
+    try:
+        new_img = None
+        for top in range(0, height, strip_rows):
+            strip = loadRows(file, top, min(top + strip_rows, height)).reduce(factor)
+            if new_img is None:
+                new_img = Image.new(strip.mode, (-(-width // factor), -(-height // factor)))
+            new_img.paste(strip, (0, top // factor))
+    finally:
+        Image.core.set_block_size(block_size)
+    return new_img
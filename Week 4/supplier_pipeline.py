@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import cpu_count, path
+import changeImage
+import hashlib
+import pipeline
+import retry_scheduler
+import run
+import scanner
+import supplier_image_upload
+import upload_journal
+
+# one pass over supplier-data/ doing the work of changeImage.py,
+# supplier_image_upload.py & run.py: each product's TIFF is read once,
+# converted in memory, uploaded as JPEG without being written to disk, then
+# its description is posted. products move through the stages concurrently.
+# uploaded products go in run.py's upload journal with their image's digest
+# too, so a rerun skips products whose image & description are both already
+# up, and run.py skips their descriptions.
+
+# set supplier dirs:
+img_dir = "supplier-data/images/"
+txt_dir = "supplier-data/descriptions/"
+
+# set pipeline vars:
+# threads reading sources:
+readers = 4
+# processes converting images:
+workers = cpu_count()
+# threads uploading, one product each (image then description):
+uploaders = 8
+# products allowed to queue up before reading, converting & uploading:
+depths = (16, 16, 16)
+
+# set retries (see retry_scheduler.py):
+max_attempts = 5
+
+
+def readProduct(uploaded, entry_id):
+    """read a product's TIFF & description, unless uploaded (the journal) has
+    both with their current content
+
+    returns (image bytes, or the file path if it is over the memory cap,
+    entry, description digest, image digest), or None to skip the product.
+    """
+    img_file = img_dir + entry_id + ".tiff"
+    txt_file = txt_dir + entry_id + ".txt"
+    # NOTE: a missing description raises here, failing just this product:
+    entry = run.getEntry(txt_file)
+    digest = upload_journal.fileDigest(txt_file)
+    if path.getsize(img_file) > changeImage.max_image_mb * 2 ** 20:
+        data = img_file
+        img_digest = upload_journal.fileDigest(img_file)
+    else:
+        data = changeImage.readImage(img_file)
+        img_digest = hashlib.sha256(data).hexdigest()
+    record = uploaded.get(entry_id, {})
+    if record.get("sha256") == digest and record.get("image_sha256") == img_digest:
+        return None
+    return data, entry, digest, img_digest
+
+
+def convertProduct(product):
+    """convert a product's image to its storefront JPEG, in memory
+
+    returns (JPEG bytes, entry, description digest, image digest, note on
+    decoding), or None for a skipped product.
+    """
+    if product is None:
+        return None
+    data, entry, digest, img_digest = product
+    rendered, note = changeImage.reprocess(data, changeImage.renditions[:1])
+    return rendered[0][1], entry, digest, img_digest, note
+
+
+def uploadProduct(scheduler, session, entry_id, converted):
+    """upload a product's JPEG, then its description once the image is in
+
+    returns (note on decoding, description digest, image digest), or None for
+    a skipped product.
+    """
+    if converted is None:
+        return None
+    jpeg, entry, digest, img_digest, note = converted
+    img_url = supplier_image_upload.url
+    files = {"file": (entry["image_name"], jpeg, "image/jpeg")}
+    scheduler.submit(img_url, session.post, img_url, files=files).result().raise_for_status()
+    headers = {"Idempotency-Key": run.idempotencyKey(entry_id, digest)}
+    scheduler.submit(run.url, session.post, run.url, data=entry,
+                     headers=headers).result().raise_for_status()
+    return note, digest, img_digest
+
+
+def main():
+    # one product per TIFF, named by its id:
+    entry_ids = (path.splitext(path.basename(entry.path))[0]
+                 for entry in scanner.scan(img_dir, include=changeImage.img_include))
+    # skip products already uploaded with the same image & description:
+    uploaded, journal_lines = upload_journal.loadJournal(run.journal_file)
+    session = supplier_image_upload.makeSession(uploaders)
+    done = failed = skipped = 0
+    scheduler = retry_scheduler.RetryScheduler(workers=uploaders, host_limit=uploaders,
+                                               max_attempts=max_attempts)
+    with scheduler, ProcessPoolExecutor(max_workers=workers) as pool, \
+            upload_journal.openJournal(run.journal_file) as journal:
+        read = partial(readProduct, uploaded)
+        upload = partial(uploadProduct, scheduler, session)
+        for entry_id, result, error in pipeline.run(
+                entry_ids, read, convertProduct, upload, readers=readers,
+                transformers=workers, writers=uploaders, depths=depths, executor=pool):
+            if error:
+                failed += 1
+                print("{}: error: {}".format(entry_id, error))
+                continue
+            if result is None:
+                skipped += 1
+                continue
+            note, digest, img_digest = result
+            uploaded[entry_id] = upload_journal.logUpload(journal, entry_id, digest,
+                                                          image_sha256=img_digest)
+            journal_lines += 1
+            done += 1
+            print("{}: uploaded image & description, {}".format(entry_id, note))
+    print("{} products uploaded, {} already uploaded, {} failed, {} retries".format(
+        done, skipped, failed, scheduler.stats["retries"]))
+
+    # compact journal once it's mostly superseded lines:
+    if journal_lines > run.journal_compact_ratio * max(1, len(uploaded)):
+        upload_journal.compactJournal(run.journal_file, uploaded)
+
+
+if __name__ == "__main__":
+    main()
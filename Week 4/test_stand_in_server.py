@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Checks the requests the feedback & fruit uploaders make, counted by the stand-in server.
+
+Run with pytest from this directory.
+"""
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import urllib.request
+import pytest
+
+here = os.path.dirname(os.path.abspath(__file__))
+week_2 = os.path.join(here, "..", "Week 2")
+
+# set test data: entries posted in batches of batch_size:
+entries = 40
+batch_size = 5
+
+
+def loadModule(name, file):
+    """import file under name, from a fresh copy each time so module globals start over"""
+    sys.path[:0] = [os.path.dirname(file)]
+    try:
+        spec = importlib.util.spec_from_file_location(name, file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        del sys.path[0]
+    return module
+
+
+@pytest.fixture(params=[[], ["--no-bulk"]], ids=["bulk", "no-bulk"])
+def server(request):
+    """start the stand-in on a free port, yield (base url, its options)"""
+    process = subprocess.Popen([sys.executable, os.path.join(here, "stand_in_server.py"),
+                                "--port", "0"] + request.param,
+                               stdout=subprocess.PIPE, text=True)
+    try:
+        # first line: "serving on http://127.0.0.1:<port>/"
+        base_url = process.stdout.readline().split()[-1]
+        yield base_url, request.param
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def serverStats(base_url):
+    """return the request & record counts the stand-in kept"""
+    with urllib.request.urlopen(base_url + "stats/") as response:
+        return json.load(response)
+
+
+def expectedPaths(stats_path, bulk):
+    """return the per-path request counts a batched upload of entries should take"""
+    if bulk:
+        return {stats_path + "bulk/": entries // batch_size}
+    # one bulk post is rejected, then every entry goes on its own:
+    return {stats_path + "bulk/": 1, stats_path: entries}
+
+
+def testFeedbackRequests(server, tmp_path):
+    base_url, options = server
+    src_dir = tmp_path / "feedback"
+    src_dir.mkdir()
+    for i in range(entries):
+        (src_dir / "{}.txt".format(i)).write_text("Title {0}\nName {0}\n2020-01-01\nFine.\n".format(i))
+
+    run = loadModule("feedback_run", os.path.join(week_2, "run.py"))
+    run.src_dir = str(src_dir) + "/"
+    run.url, run.bulk_url = base_url + "feedback/", base_url + "feedback/bulk/"
+    run.batch_size = batch_size
+    run.report_file = str(tmp_path / "metrics.json")
+    run.main()
+
+    stats = serverStats(base_url)
+    assert stats["records"] == entries
+    assert stats["paths"] == expectedPaths("/feedback/", "--no-bulk" not in options)
+
+
+def testFruitRequests(server, tmp_path):
+    base_url, options = server
+    txt_dir = tmp_path / "descriptions"
+    txt_dir.mkdir()
+    for i in range(entries):
+        (txt_dir / "{}.txt".format(i)).write_text("Fruit {}\n50 lbs\nFresh.\n".format(i))
+
+    run = loadModule("fruit_run", os.path.join(here, "run.py"))
+    run.txt_dir = str(txt_dir) + "/"
+    run.url, run.bulk_url = base_url + "fruits/", base_url + "fruits/bulk/"
+    run.batch_size = batch_size
+    run.journal_file = str(tmp_path / "journal.jsonl")
+    run.report_file = str(tmp_path / "metrics.json")
+    run.main()
+
+    stats = serverStats(base_url)
+    assert stats["records"] == entries
+    assert stats["paths"] == expectedPaths("/fruits/", "--no-bulk" not in options)
+
+    # a rerun finds every entry journaled & posts nothing:
+    run.main()
+    assert serverStats(base_url)["requests"] == stats["requests"]
+
+
+def testSummary():
+    stand_in = loadModule("stand_in_server", os.path.join(here, "stand_in_server.py"))
+    stand_in.stats.update(requests=8, records=40, rejected=0)
+    assert stand_in.summary() == ("received 40 records in 8 requests, 0 rejected "
+                                  "(80% fewer than one request per record)")
+    stand_in.stats.update(requests=41, records=40, rejected=1)
+    assert stand_in.summary() == ("received 40 records in 41 requests, 1 rejected "
+                                  "(1 more than one request per record)")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+import hashlib
+import json
+import os
+
+
+def fileDigest(file):
+    """return sha256 of a file's contents, read a block at a time"""
+    sha = hashlib.sha256()
+    with open(file, "rb") as f:
+        for block in iter(lambda: f.read(2 ** 20), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def loadJournal(journal_file):
+    """read the journal, return ({entry id: record}, lines read)
+
+    a record holds the entry's "id", content hash ("sha256") & the server's
+    acknowledgement ("ack") if one was logged. later lines win, so an entry
+    re-uploaded after changing maps to its latest record. a line cut short
+    by a crash is ignored.
+    """
+    entries = {}
+    lines = 0
+    try:
+        with open(journal_file) as f:
+            for line in f:
+                lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                entries[record["id"]] = record
+    except FileNotFoundError:
+        pass
+    return entries, lines
+
+
+def journaledDigest(entries, entry_id):
+    """return the content hash an entry was last uploaded with, or None"""
+    record = entries.get(entry_id)
+    return record["sha256"] if record else None
+
+
+def trimPartialLine(journal_file):
+    """cut off a last line a crash left unfinished, so appends start a line of their own"""
+    try:
+        f = open(journal_file, "r+b")
+    except FileNotFoundError:
+        return
+    with f:
+        end = pos = f.seek(0, os.SEEK_END)
+        keep = 0
+        # look back from the end a block at a time for the last newline:
+        while pos > 0:
+            start = max(0, pos - 4096)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            pos = start
+        if keep != end:
+            f.truncate(keep)
+
+
+def openJournal(journal_file):
+    """open the journal for appending records, dropping any partial last line first"""
+    trimPartialLine(journal_file)
+    return open(journal_file, "a")
+
+
+def logUpload(journal, entry_id, digest, ack=None, **fields):
+    """append a successful upload, synced so it survives a crash, return its record
+
+    ack, if given, is kept with it as the server's acknowledgement (e.g. the
+    ETag it answered with), & so are any other fields.
+    """
+    record = {"id": entry_id, "sha256": digest}
+    if ack is not None:
+        record["ack"] = ack
+    record.update(fields)
+    journal.write(json.dumps(record) + "\n")
+    journal.flush()
+    os.fsync(journal.fileno())
+    return record
+
+
+def compactJournal(journal_file, entries):
+    """rewrite the journal with one line per entry ({entry id: record}, acks
+    included), replacing it atomically"""
+    tmp_file = journal_file + ".tmp"
+    with open(tmp_file, "w") as f:
+        for entry_id, record in sorted(entries.items()):
+            f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, journal_file)
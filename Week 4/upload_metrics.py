@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+import bisect
+import collections
+import json
+import sys
+import threading
+import time
+
+# latency histogram bucket upper bounds in ms, 10 per decade from 0.1ms to 100s
+# (each ~26% above the last, which bounds the error of percentiles read off it):
+bucket_bounds = [round(10 ** (k / 10), 4) for k in range(-10, 51)]
+
+
+def sent_bytes(response):
+    """Returns the size of the request body a response answered."""
+    body = response.request.body
+    return len(body) if body is not None else 0
+
+
+class UploadMetrics:
+    """Counts requests, records & bytes sent, latencies and statuses for an uploader.
+
+    record() counts a request, attempt() one answered by a response (or an
+    error), delivered() records the server accepted; all are safe to call
+    from any thread. While the run is going a
+    progress line is redrawn on stderr (at most every interval seconds, and
+    only on a terminal). finish() prints a summary and writes the same
+    numbers as JSON for other tools to pick up.
+    """
+
+    def __init__(self, total=None, interval=0.5, stream=sys.stderr):
+        self.total = total
+        self.interval = interval
+        self.stream = stream
+        self.live = stream.isatty()
+        self.start = time.perf_counter()
+        self.requests = self.records = self.sent = self.timed = 0
+        self.statuses = collections.Counter()
+        self.buckets = [0] * (len(bucket_bounds) + 1)
+        self.slowest = 0.0
+        self._lock = threading.Lock()
+        self._drawn = 0.0
+
+    def record(self, status, seconds, sent=0, records=1):
+        """Counts one request: its status (or error name), time taken (None if
+        it got no response), bytes sent & the records it carried."""
+        with self._lock:
+            self.requests += 1
+            self.records += records
+            self.sent += sent
+            self.statuses[status] += 1
+            if seconds is not None:
+                ms = seconds * 1000
+                self.timed += 1
+                self.buckets[bisect.bisect_left(bucket_bounds, ms)] += 1
+                self.slowest = max(self.slowest, ms)
+            self._draw()
+
+    def attempt(self, response, error=None):
+        """Counts one request from its response, or the error it raised instead.
+
+        Fits RetryScheduler's on_attempt, so retried attempts are counted too.
+        Records are counted apart, with delivered().
+        """
+        if error is not None:
+            self.record(type(error).__name__, None, records=0)
+        else:
+            # elapsed runs from sending the request to reading the reply's headers:
+            self.record(response.status_code, response.elapsed.total_seconds(),
+                        sent_bytes(response), records=0)
+
+    def delivered(self, records):
+        """Counts records the server accepted."""
+        with self._lock:
+            self.records += records
+            self._draw()
+
+    def _draw(self):
+        now = time.perf_counter()
+        if self.live and now - self._drawn >= self.interval:
+            self._drawn = now
+            self.stream.write("\r" + self._line(now - self.start) + "\033[K")
+            self.stream.flush()
+
+    def percentile(self, share):
+        """Returns the latency in ms below which share of responses came back,
+        to within a histogram bucket."""
+        rank = share * self.timed
+        seen = 0
+        for bound, n in zip(bucket_bounds, self.buckets):
+            seen += n
+            if n and seen >= rank:
+                return min(bound, self.slowest)
+        return self.slowest
+
+    def errors(self):
+        """Returns requests that got an error status or no response at all."""
+        return sum(n for status, n in self.statuses.items()
+                   if not isinstance(status, int) or status >= 400)
+
+    def _line(self, elapsed):
+        done = "{}/{}".format(self.records, self.total) if self.total else str(self.records)
+        rate = 1 / elapsed if elapsed else 0
+        return "{:.1f}s {} records, {:.1f} req/s, {:.2f} MB/s, p50 {:.1f}ms, p95 {:.1f}ms, {} errors".format(
+            elapsed, done, self.requests * rate, self.sent * rate / 1e6,
+            self.percentile(0.5), self.percentile(0.95), self.errors())
+
+    def report(self, **extra):
+        """Returns the run's numbers as a dict, with extra fields added."""
+        with self._lock:
+            elapsed = time.perf_counter() - self.start
+            histogram = {"le_{}ms".format(bound): n for bound, n in zip(bucket_bounds, self.buckets) if n}
+            if self.buckets[-1]:
+                histogram["inf"] = self.buckets[-1]
+            report = {
+                "elapsed_s": round(elapsed, 3),
+                "requests": self.requests,
+                "records": self.records,
+                "bytes_sent": self.sent,
+                "requests_per_s": round(self.requests / elapsed, 2) if elapsed else 0,
+                "bytes_per_s": round(self.sent / elapsed) if elapsed else 0,
+                "statuses": {str(status): n for status, n in sorted(self.statuses.items(), key=str)},
+                "error_rate": round(self.errors() / self.requests, 4) if self.requests else 0,
+                "latency_ms": {"p50": self.percentile(0.5), "p95": self.percentile(0.95),
+                               "p99": self.percentile(0.99), "max": round(self.slowest, 3)},
+                "latency_histogram_ms": histogram,
+            }
+        report.update(extra)
+        return report
+
+    def finish(self, report_file=None, **extra):
+        """Prints a summary & writes the report to report_file (if given) as JSON,
+        returns the report."""
+        report = self.report(**extra)
+        if self.live:
+            self.stream.write("\r\033[K")
+        print(self._line(report["elapsed_s"]))
+        for status, n in report["statuses"].items():
+            print("  {}: {}".format(status, n))
+        if report_file:
+            with open(report_file, "w") as f:
+                json.dump(report, f, indent=2)
+                f.write("\n")
+            print("  report written to {}".format(report_file))
+        return report